@@ -2,13 +2,27 @@
 IP Address Service - A simple Flask app for IP discovery in containers
 """
 
+# Monkey-patch as early as possible so socket/subprocess/threading become
+# greenlet-friendly when running under the gevent Gunicorn worker
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
 from flask import Flask, jsonify, request, Response
 from flask_cors import CORS
+import json
 import socket
 import os
+import re
+import shutil
+import signal
 import subprocess
 import logging
 import sys
+import threading
+import time
 from datetime import datetime
 from functools import wraps
 
@@ -19,8 +33,38 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# fcntl/struct are Unix-only - used for the ioctl-based IP lookup fallback
+try:
+    import fcntl
+    import struct
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+# Try to use orjson (Rust-based, several times faster than stdlib json on
+# the small dicts this service returns) for all jsonify responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 app = Flask(__name__)
 
+if ORJSON_AVAILABLE:
+    from flask.json.provider import JSONProvider
+
+    class ORJSONProvider(JSONProvider):
+        """Route jsonify through orjson instead of stdlib json"""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+
 # Configuration
 PORT = int(os.environ.get('PORT', 5252))
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
@@ -28,6 +72,8 @@ APP_NAME = os.environ.get('APP_NAME', 'ip-service')
 SHOW_LOCALHOST_IPS = os.environ.get('SHOW_LOCALHOST_IPS', 'false').lower() == 'true'
 CORS_ENABLED = os.environ.get('CORS_ENABLED', 'true').lower() == 'true'
 VERSION = '1.0.0'
+IP_CACHE_TTL = float(os.environ.get('IP_CACHE_TTL', '30'))
+METRICS_CACHE_TTL = float(os.environ.get('METRICS_CACHE_TTL', '2'))
 
 # Enable CORS if configured
 if CORS_ENABLED:
@@ -44,86 +90,238 @@ logger = logging.getLogger(APP_NAME)
 # Track startup time for uptime calculation
 START_TIME = datetime.now()
 
+# Hostname is immutable for the lifetime of a container process - look it
+# up once instead of issuing a syscall on every request
+HOSTNAME = socket.gethostname()
+
+
+def _refresh_hostname(signum, frame):
+    """SIGHUP handler to re-read the hostname without a restart"""
+    global HOSTNAME, _CONFIG_BODY
+    HOSTNAME = socket.gethostname()
+    _CONFIG_BODY = _build_config_body()
+    logger.info(f"Hostname refreshed: {HOSTNAME}")
+
+
+try:
+    signal.signal(signal.SIGHUP, _refresh_hostname)
+except (AttributeError, ValueError):
+    # SIGHUP unavailable (Windows) or not running in the main thread
+    pass
+
+# Warm up psutil's CPU counter once so later non-blocking cpu_percent()
+# calls return a meaningful delta instead of 0.0
+if PSUTIL_AVAILABLE:
+    psutil.cpu_percent(interval=None)
+
+# Cache for iso_timestamp() - under load many requests land in the same
+# wall-clock second, so only re-format the ISO string when it ticks over
+_TS_CACHE = {'sec': 0, 'iso': ''}
+
+
+def iso_timestamp():
+    """Current time as an ISO string, re-formatted at most once per second"""
+    sec = int(time.time())
+    if sec != _TS_CACHE['sec']:
+        _TS_CACHE['iso'] = datetime.now().isoformat()
+        _TS_CACHE['sec'] = sec
+    return _TS_CACHE['iso']
+
 
 def log_request(f):
     """Decorator to log incoming requests"""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        logger.info(f"{request.method} {request.path} - {request.remote_addr}")
+        # %-style args defer string assembly until the record is actually
+        # emitted - no formatting cost when LOG_LEVEL is WARNING or higher
+        if logger.isEnabledFor(logging.INFO):
+            # Resolve the request proxy once instead of per attribute
+            r = request._get_current_object()
+            logger.info("%s %s - %s", r.method, r.path, r.remote_addr)
         return f(*args, **kwargs)
     return decorated_function
 
 
-def get_ip_addresses():
-    """Get all IP addresses similar to hostname -I"""
-    ip_addresses = []
-    
-    # Method 1: Use hostname -I (BEST method - gets all interface IPs like 'hostname -I')
+# Regex for extracting IPv4 addresses from 'ip addr' output (compiled once,
+# bytes pattern so the subprocess output is scanned without a UTF-8 decode)
+IP_ADDR_PATTERN = re.compile(rb'inet\s+(\d+\.\d+\.\d+\.\d+)')
+
+
+def _is_keeper(ip):
+    """True if an IP should be included in results per SHOW_LOCALHOST_IPS"""
+    return SHOW_LOCALHOST_IPS or (not ip.startswith('127.') and ':' not in ip)
+
+
+# ioctl request number for SIOCGIFADDR (get interface address) on Linux
+SIOCGIFADDR = 0x8915
+
+# Resolved executable paths for _run_capture (one PATH search per command)
+_COMMAND_PATHS = {}
+
+
+def _run_capture(argv):
+    """Run a command and capture stdout, using CPython's posix_spawn fast path.
+
+    subprocess only takes the posix_spawn route (no fork+COW of the whole
+    worker) when given an absolute executable path with close_fds=False.
+    Both are safe here: the path is resolved once via shutil.which, and
+    Python-created fds are CLOEXEC so nothing leaks to the child.
+    """
+    exe = _COMMAND_PATHS.get(argv[0])
+    if exe is None:
+        exe = shutil.which(argv[0])
+        if exe is None:
+            raise FileNotFoundError(argv[0])
+        _COMMAND_PATHS[argv[0]] = exe
+    return subprocess.run([exe] + argv[1:], capture_output=True, close_fds=False)
+
+# Cache for get_ip_addresses() - IPs rarely change inside a container, so
+# avoid re-running subprocesses/interface walks on every request. The raw
+# 'hostname -I' output shown by /interfaces shares the same entry so it is
+# forked at most once per TTL window.
+_IP_CACHE = {'value': None, 'ts': 0.0, 'raw': None, 'raw_ts': 0.0, 'body': None}
+_IP_CACHE_LOCK = threading.Lock()
+
+
+def get_ip_addresses(refresh=False):
+    """Get all IP addresses similar to hostname -I (cached for IP_CACHE_TTL seconds)"""
+    if not refresh:
+        if _IP_CACHE['value'] is not None and time.monotonic() - _IP_CACHE['ts'] < IP_CACHE_TTL:
+            return _IP_CACHE['value']
+
+    # Single-flight: when a stale value exists, only one thread/greenlet
+    # recomputes and everyone else serves the stale copy instead of piling
+    # up on the lock. Block only when there is nothing to serve yet (cold
+    # start) or the caller explicitly demanded fresh data.
+    must_wait = refresh or _IP_CACHE['value'] is None
+    if not _IP_CACHE_LOCK.acquire(blocking=must_wait):
+        return _IP_CACHE['value']
     try:
-        result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            ips = result.stdout.strip().split()
-            logger.debug(f"hostname -I output: {ips}")
-            for ip in ips:
-                # Filter localhost IPs unless configured to show them
-                is_localhost = ip.startswith('127.')
-                is_ipv6 = ':' in ip
-                
-                if SHOW_LOCALHOST_IPS or (not is_localhost and not is_ipv6):
-                    if ip not in ip_addresses:
-                        ip_addresses.append(ip)
-            logger.debug(f"IPs from hostname -I: {ip_addresses}")
-            # If we got IPs this way, return them immediately (most reliable)
-            if ip_addresses:
-                return ip_addresses
-    except Exception as e:
-        logger.debug(f"Hostname -I command failed: {e}")
-    
-    # Method 2: Try using 'ip addr' command
+        # Re-check after acquiring the lock - another thread may have
+        # refreshed the cache while we were waiting
+        if not refresh:
+            if _IP_CACHE['value'] is not None and time.monotonic() - _IP_CACHE['ts'] < IP_CACHE_TTL:
+                return _IP_CACHE['value']
+
+        ip_addresses = _collect_ip_addresses()
+        _IP_CACHE['value'] = ip_addresses
+        # Pre-render the plain-text body served by / - it is constant for
+        # the rest of the cache window
+        ip_string = ' '.join(ip_addresses) if ip_addresses else 'No IP addresses found'
+        _IP_CACHE['body'] = (ip_string + '\n').encode()
+        _IP_CACHE['ts'] = time.monotonic()
+        return ip_addresses
+    finally:
+        _IP_CACHE_LOCK.release()
+
+
+def get_hostname_i_raw(refresh=False):
+    """Raw 'hostname -I' output for /interfaces, cached for IP_CACHE_TTL seconds"""
+    if not refresh:
+        if _IP_CACHE['raw'] is not None and time.monotonic() - _IP_CACHE['raw_ts'] < IP_CACHE_TTL:
+            return _IP_CACHE['raw']
+
     try:
-        result = subprocess.run(['ip', '-4', 'addr', 'show'], capture_output=True, text=True)
+        result = _run_capture(['hostname', '-I'])
         if result.returncode == 0:
-            import re
-            # Extract IP addresses from 'ip addr' output
-            ip_pattern = re.compile(r'inet\s+(\d+\.\d+\.\d+\.\d+)')
-            found_ips = ip_pattern.findall(result.stdout)
-            logger.debug(f"ip addr output IPs: {found_ips}")
-            for ip in found_ips:
-                if SHOW_LOCALHOST_IPS or not ip.startswith('127.'):
-                    if ip not in ip_addresses:
-                        ip_addresses.append(ip)
+            _IP_CACHE['raw'] = result.stdout.decode().strip()
+            _IP_CACHE['raw_ts'] = time.monotonic()
     except Exception as e:
-        logger.debug(f"ip addr command failed: {e}")
-    
-    # Method 3: Use psutil if available (very reliable)
+        logger.debug(f"Hostname -I command failed: {e}")
+    return _IP_CACHE['raw']
+
+
+def _collect_ip_addresses():
+    """Do the actual (expensive) IP discovery"""
+    # Insertion-ordered dict keys give O(1) dedup while keeping order
+    ip_addresses = {}
+
+    # Method 1: Use psutil if available (BEST method - in-process, no fork/exec)
     if PSUTIL_AVAILABLE:
         try:
-            import psutil
             interfaces = psutil.net_if_addrs()
             for interface_name, addresses in interfaces.items():
                 for addr in addresses:
                     if addr.family == socket.AF_INET:  # IPv4 only
                         ip = addr.address
-                        if SHOW_LOCALHOST_IPS or not ip.startswith('127.'):
-                            if ip not in ip_addresses:
-                                ip_addresses.append(ip)
+                        if _is_keeper(ip):
+                            ip_addresses.setdefault(ip, None)
             logger.debug(f"IPs from psutil: {ip_addresses}")
+            # If we got IPs this way, return them immediately (most reliable)
+            if ip_addresses:
+                return list(ip_addresses)
         except Exception as e:
             logger.debug(f"psutil method failed: {e}")
-    
+
+    # Method 2: Query each interface directly via ioctl (no subprocess either)
+    if FCNTL_AVAILABLE:
+        try:
+            for _, iface_name in socket.if_nameindex():
+                try:
+                    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                    try:
+                        packed_iface = struct.pack('256s', iface_name[:15].encode())
+                        ip = socket.inet_ntoa(
+                            fcntl.ioctl(s.fileno(), SIOCGIFADDR, packed_iface)[20:24])
+                    finally:
+                        s.close()
+                except OSError:
+                    # Interface has no IPv4 address assigned
+                    continue
+                if _is_keeper(ip):
+                    ip_addresses.setdefault(ip, None)
+            logger.debug(f"IPs from ioctl: {ip_addresses}")
+            if ip_addresses:
+                return list(ip_addresses)
+        except Exception as e:
+            logger.debug(f"ioctl method failed: {e}")
+
+    # Method 3: Use hostname -I (subprocess fallback)
+    try:
+        result = _run_capture(['hostname', '-I'])
+        stdout = result.stdout.decode().strip()
+        if result.returncode == 0 and stdout:
+            # Ran it anyway, so keep the raw output fresh for /interfaces
+            _IP_CACHE['raw'] = stdout
+            _IP_CACHE['raw_ts'] = time.monotonic()
+            ips = stdout.split()
+            logger.debug(f"hostname -I output: {ips}")
+            for ip in ips:
+                # Filter localhost/IPv6 IPs unless configured to show them
+                if _is_keeper(ip):
+                    ip_addresses.setdefault(ip, None)
+            logger.debug(f"IPs from hostname -I: {ip_addresses}")
+            if ip_addresses:
+                return list(ip_addresses)
+    except Exception as e:
+        logger.debug(f"Hostname -I command failed: {e}")
+
+    # Method 3b: Try using 'ip addr' command
+    try:
+        # Keep stdout as bytes - the pattern matches raw output, so the
+        # full dump never needs a UTF-8 decode
+        result = _run_capture(['ip', '-4', 'addr', 'show'])
+        if result.returncode == 0:
+            # Extract IP addresses from 'ip addr' output
+            found_ips = IP_ADDR_PATTERN.findall(result.stdout)
+            logger.debug(f"ip addr output IPs: {found_ips}")
+            for raw_ip in found_ips:
+                ip = raw_ip.decode()
+                if _is_keeper(ip):
+                    ip_addresses.setdefault(ip, None)
+    except Exception as e:
+        logger.debug(f"ip addr command failed: {e}")
+
     # Method 4: Fallback to socket.getaddrinfo (hostname resolution)
     if not ip_addresses:
         try:
-            hostname = socket.gethostname()
-            ips = socket.getaddrinfo(hostname, None)
+            # AF_INET skips the AAAA lookup, which can stall for seconds on
+            # containers without IPv6
+            ips = socket.getaddrinfo(HOSTNAME, None, socket.AF_INET, socket.SOCK_STREAM)
             for ip in ips:
                 ip_addr = ip[4][0]
-                is_localhost = ip_addr.startswith('127.')
-                is_ipv6 = ':' in ip_addr
-                
-                if SHOW_LOCALHOST_IPS or (not is_localhost and not is_ipv6):
-                    if ip_addr not in ip_addresses:
-                        ip_addresses.append(ip_addr)
+                if _is_keeper(ip_addr):
+                    ip_addresses.setdefault(ip_addr, None)
         except Exception as e:
             logger.debug(f"Socket getaddrinfo failed: {e}")
     
@@ -131,59 +329,95 @@ def get_ip_addresses():
     if not ip_addresses:
         try:
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.settimeout(0)
+            # Explicitly non-blocking - UDP connect never sends a packet,
+            # it just binds the local address for getsockname()
+            s.setblocking(False)
             try:
                 s.connect(('10.254.254.254', 1))
                 primary_ip = s.getsockname()[0]
-                if SHOW_LOCALHOST_IPS or not primary_ip.startswith('127.'):
-                    if primary_ip not in ip_addresses:
-                        ip_addresses.append(primary_ip)
-            except Exception:
+                if _is_keeper(primary_ip):
+                    ip_addresses.setdefault(primary_ip, None)
+            except OSError:
                 pass
             finally:
                 s.close()
         except Exception as e:
             logger.debug(f"Default route IP detection failed: {e}")
     
-    return ip_addresses
+    return list(ip_addresses)
+
+
+# Cache for get_system_metrics() - psutil reads are throttled to at most
+# one collection per METRICS_CACHE_TTL seconds
+_METRICS_CACHE = {'value': None, 'ts': 0.0, 'calls': 0}
+_METRICS_CACHE_LOCK = threading.Lock()
+
+# Disk capacity rarely changes, so only re-stat it every Nth collection
+_DISK_REFRESH_EVERY = 10
+_DISK_METRICS = {}
 
 
 def get_system_metrics():
-    """Get system metrics if psutil is available"""
+    """Get system metrics if psutil is available (cached for METRICS_CACHE_TTL seconds)"""
+    if _METRICS_CACHE['value'] is not None and time.monotonic() - _METRICS_CACHE['ts'] < METRICS_CACHE_TTL:
+        return _METRICS_CACHE['value']
+
+    # Single-flight refresh, same as the IP cache: one collector, everyone
+    # else serves the stale reading until it lands
+    if not _METRICS_CACHE_LOCK.acquire(blocking=_METRICS_CACHE['value'] is None):
+        return _METRICS_CACHE['value']
+    try:
+        if _METRICS_CACHE['value'] is not None and time.monotonic() - _METRICS_CACHE['ts'] < METRICS_CACHE_TTL:
+            return _METRICS_CACHE['value']
+
+        metrics = _collect_system_metrics()
+        _METRICS_CACHE['value'] = metrics
+        _METRICS_CACHE['ts'] = time.monotonic()
+        return metrics
+    finally:
+        _METRICS_CACHE_LOCK.release()
+
+
+def _collect_system_metrics():
+    """Do the actual psutil reads"""
     metrics = {
         'uptime_seconds': int((datetime.now() - START_TIME).total_seconds()),
         'psutil_available': PSUTIL_AVAILABLE
     }
-    
+
     if PSUTIL_AVAILABLE:
         try:
-            # CPU metrics
-            metrics['cpu_percent'] = psutil.cpu_percent(interval=0.1)
+            # CPU metrics - non-blocking: returns usage since the previous
+            # call instead of sleeping on the request thread
+            metrics['cpu_percent'] = psutil.cpu_percent(interval=None)
             metrics['cpu_count'] = psutil.cpu_count()
-            
+
             # Memory metrics
             memory = psutil.virtual_memory()
             metrics['memory_percent'] = memory.percent
             metrics['memory_used_mb'] = round(memory.used / (1024 * 1024), 2)
             metrics['memory_total_mb'] = round(memory.total / (1024 * 1024), 2)
             metrics['memory_available_mb'] = round(memory.available / (1024 * 1024), 2)
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            metrics['disk_percent'] = disk.percent
-            metrics['disk_used_gb'] = round(disk.used / (1024 ** 3), 2)
-            metrics['disk_free_gb'] = round(disk.free / (1024 ** 3), 2)
-            metrics['disk_total_gb'] = round(disk.total / (1024 ** 3), 2)
-            
+
+            # Disk metrics (refreshed every Nth collection - capacity rarely changes)
+            if not _DISK_METRICS or _METRICS_CACHE['calls'] % _DISK_REFRESH_EVERY == 0:
+                disk = psutil.disk_usage('/')
+                _DISK_METRICS['disk_percent'] = disk.percent
+                _DISK_METRICS['disk_used_gb'] = round(disk.used / (1024 ** 3), 2)
+                _DISK_METRICS['disk_free_gb'] = round(disk.free / (1024 ** 3), 2)
+                _DISK_METRICS['disk_total_gb'] = round(disk.total / (1024 ** 3), 2)
+            metrics.update(_DISK_METRICS)
+            _METRICS_CACHE['calls'] += 1
+
             # Network metrics
             net_io = psutil.net_io_counters()
             metrics['network_bytes_sent'] = net_io.bytes_sent
             metrics['network_bytes_recv'] = net_io.bytes_recv
-            
+
         except Exception as e:
             logger.error(f"Error getting system metrics: {e}")
             metrics['error'] = str(e)
-    
+
     return metrics
 
 
@@ -243,21 +477,22 @@ def get_network_interfaces():
 @log_request
 def index():
     """Return IP addresses like hostname -I"""
-    ips = get_ip_addresses()
-    ip_string = ' '.join(ips) if ips else 'No IP addresses found'
-    return Response(ip_string + '\n', mimetype='text/plain')
+    get_ip_addresses(refresh=request.args.get('refresh') == '1')
+    # Body bytes are pre-rendered on cache refresh; direct_passthrough
+    # skips werkzeug's response-iterator wrapping for tiny bodies
+    return Response(_IP_CACHE['body'], mimetype='text/plain', direct_passthrough=True)
 
 
 @app.route('/json')
 @log_request
 def json_endpoint():
     """Return IP addresses as JSON"""
-    ips = get_ip_addresses()
+    ips = get_ip_addresses(refresh=request.args.get('refresh') == '1')
     return jsonify({
-        'hostname': socket.gethostname(),
+        'hostname': HOSTNAME,
         'ip_addresses': ips,
         'count': len(ips),
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': iso_timestamp(),
         'version': VERSION
     })
 
@@ -266,61 +501,85 @@ def json_endpoint():
 @log_request
 def interfaces_endpoint():
     """Return detailed network interface information"""
+    refresh = request.args.get('refresh') == '1'
     interfaces = get_network_interfaces()
-    ips = get_ip_addresses()
-    
-    # Also get raw hostname -I output for comparison
-    hostname_i_output = None
-    try:
-        result = subprocess.run(['hostname', '-I'], capture_output=True, text=True)
-        if result.returncode == 0:
-            hostname_i_output = result.stdout.strip()
-    except:
-        pass
-    
+    ips = get_ip_addresses(refresh=refresh)
+
+    # Also get raw hostname -I output for comparison (cached - previously
+    # this forked hostname a second time on every hit)
+    hostname_i_output = get_hostname_i_raw(refresh=refresh)
+
     return jsonify({
-        'hostname': socket.gethostname(),
+        'hostname': HOSTNAME,
         'ip_addresses': ips,
         'ip_count': len(ips),
         'hostname_i_raw': hostname_i_output,
         'interfaces': interfaces,
         'show_localhost_ips_config': SHOW_LOCALHOST_IPS,
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': iso_timestamp(),
         'version': VERSION
     })
 
 
+# Everything in /health except the timestamp is fixed for the process
+# lifetime - serialize the static part once and only splice in the time
+_HEALTH_TEMPLATE = (
+    b'{"status": "healthy", "timestamp": "%b", "app_name": '
+    + json.dumps(APP_NAME).encode() + b', "version": '
+    + json.dumps(VERSION).encode() + b'}'
+)
+
+
+def _build_config_body():
+    """Serialize the /config response once - it is entirely static"""
+    return json.dumps({
+        'app_name': APP_NAME,
+        'version': VERSION,
+        'port': PORT,
+        'log_level': LOG_LEVEL,
+        'cors_enabled': CORS_ENABLED,
+        'show_localhost_ips': SHOW_LOCALHOST_IPS,
+        'python_version': sys.version,
+        'hostname': HOSTNAME
+    }).encode()
+
+
+_CONFIG_BODY = _build_config_body()
+
+
 @app.route('/health')
 @log_request
 def health():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'app_name': APP_NAME,
-        'version': VERSION
-    })
+    body = _HEALTH_TEMPLATE % iso_timestamp().encode()
+    return Response(body, mimetype='application/json')
 
 
 @app.route('/request-info')
 @log_request
 def request_info():
     """Return information about the incoming request"""
-    headers = dict(request.headers)
-    
+    # Resolve the request proxy once - every attribute below would
+    # otherwise walk the werkzeug context stack again
+    r = request._get_current_object()
+
+    # Single pass over EnvironHeaders - no intermediate copy, and reading
+    # the User-Agent header directly skips werkzeug's full UA parse
+    headers = dict(r.headers.items())
+
     return jsonify({
-        'remote_addr': request.remote_addr,
-        'remote_port': request.environ.get('REMOTE_PORT'),
-        'user_agent': request.user_agent.string,
-        'method': request.method,
-        'path': request.path,
-        'url': request.url,
-        'scheme': request.scheme,
-        'is_secure': request.is_secure,
-        'content_type': request.content_type,
-        'content_length': request.content_length,
+        'remote_addr': r.remote_addr,
+        'remote_port': r.environ.get('REMOTE_PORT'),
+        'user_agent': r.headers.get('User-Agent', ''),
+        'method': r.method,
+        'path': r.path,
+        'url': r.url,
+        'scheme': r.scheme,
+        'is_secure': r.is_secure,
+        'content_type': r.content_type,
+        'content_length': r.content_length,
         'headers': headers,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': iso_timestamp()
     })
 
 
@@ -329,7 +588,7 @@ def request_info():
 def metrics():
     """Return system metrics"""
     return jsonify({
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': iso_timestamp(),
         'metrics': get_system_metrics()
     })
 
@@ -338,29 +597,21 @@ def metrics():
 @log_request
 def config():
     """Return current configuration (safe values only)"""
-    return jsonify({
-        'app_name': APP_NAME,
-        'version': VERSION,
-        'port': PORT,
-        'log_level': LOG_LEVEL,
-        'cors_enabled': CORS_ENABLED,
-        'show_localhost_ips': SHOW_LOCALHOST_IPS,
-        'python_version': sys.version,
-        'hostname': socket.gethostname()
-    })
+    return Response(_CONFIG_BODY, mimetype='application/json')
 
 
 @app.route('/all')
 @log_request
 def all_info():
     """Return all information in one endpoint"""
+    r = request._get_current_object()
     return jsonify({
-        'hostname': socket.gethostname(),
-        'ip_addresses': get_ip_addresses(),
+        'hostname': HOSTNAME,
+        'ip_addresses': get_ip_addresses(refresh=r.args.get('refresh') == '1'),
         'request': {
-            'remote_addr': request.remote_addr,
-            'user_agent': request.user_agent.string,
-            'method': request.method
+            'remote_addr': r.remote_addr,
+            'user_agent': r.headers.get('User-Agent', ''),
+            'method': r.method
         },
         'metrics': get_system_metrics(),
         'config': {
@@ -368,7 +619,7 @@ def all_info():
             'version': VERSION,
             'port': PORT
         },
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': iso_timestamp(),
         'version': VERSION
     })
 
@@ -376,21 +627,21 @@ def all_info():
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    logger.warning(f"404 error: {request.path}")
+    logger.warning("404 error: %s", request.path)
     return jsonify({
         'error': 'Not found',
         'path': request.path,
-        'timestamp': datetime.now().isoformat()
+        'timestamp': iso_timestamp()
     }), 404
 
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f"500 error: {str(error)}")
+    logger.error("500 error: %s", error)
     return jsonify({
         'error': 'Internal server error',
-        'timestamp': datetime.now().isoformat()
+        'timestamp': iso_timestamp()
     }), 500
 
 